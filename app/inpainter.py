@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import cv2
 import numpy as np
 
 
 class Inpainter:
-    def inpaint(self, frame: np.ndarray, mask: np.ndarray, radius: int) -> np.ndarray:
+    def inpaint(
+        self, frame: np.ndarray, mask: np.ndarray, radius: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         if mask.max() == 0:
             return frame
         radius = max(1, min(radius, 12))
-        return cv2.inpaint(frame, mask, radius, cv2.INPAINT_NS)
+        if out is not None and (out.shape != frame.shape or out.dtype != frame.dtype):
+            out = None
+        return cv2.inpaint(frame, mask, radius, cv2.INPAINT_NS, dst=out)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import os
+import sys
+
+from loguru import logger
+
+
+def configure_logging() -> None:
+    """
+    Routes Loguru records through a background queue so sink writes never block the event loop
+    or worker threads. Set ``LOG_FILE`` to additionally write a rotated log file.
+    """
+    level = os.getenv("LOG_LEVEL", "INFO")
+    logger.remove()
+    logger.add(sys.stderr, level=level, enqueue=True, backtrace=False, diagnose=False)
+    log_file = os.getenv("LOG_FILE")
+    if log_file:
+        logger.add(log_file, level=level, rotation="100 MB", enqueue=True, backtrace=False, diagnose=False)
@@ -1,30 +1,92 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import multiprocessing
 import os
+import re
 import shutil
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import BinaryIO, Optional
+from urllib.parse import ParseResult, urlparse
 
 import httpx
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from loguru import logger
-
-from .storage import is_s3_enabled, upload_video_and_get_url
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from . import worker
+from .logging_utils import configure_logging
+from .result_cache import ResultCache, build_cache_key, hash_file
+from .storage import (
+    S3_ENABLED,
+    download_object_to_path,
+    get_object_size,
+    get_s3_settings,
+    resolve_bucket_key,
+)
 from .task_manager import TaskManager
 from .video_processor import VideoProcessingOptions, VideoProcessor
 
 MAX_FILE_SIZE_MB = 100
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
-STREAM_CHUNK_SIZE = 1024 * 1024
+# Uploads are read back from Starlette's spooled temp file, downloads come off the socket;
+# the two paths peak at different buffer sizes so they are tuned independently.
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+DOWNLOAD_CHUNK_SIZE = int(os.getenv("DOWNLOAD_CHUNK_SIZE", str(512 * 1024)))
 DOWNLOAD_TIMEOUT_SECONDS = float(os.getenv("DOWNLOAD_TIMEOUT_SECONDS", "120"))
-
-app = FastAPI(title="Subtitle Cleaner", version="0.2.0")
+# Slack for multipart boundaries and form fields on top of the file itself.
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+UPLOAD_PATHS = frozenset({"/clean", "/preview"})
+CALLBACK_TIMEOUT_SECONDS = 10.0
+SHUTDOWN_CALLBACK_GRACE_SECONDS = 5.0
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+CLEAN_PROCESSES = max(1, int(os.getenv("CLEAN_PROCESSES", "2")))
+CLEAN_QUEUE_SIZE = max(1, int(os.getenv("CLEAN_QUEUE", "32")))
+CLEAN_QUEUE_TIMEOUT_SECONDS = float(os.getenv("CLEAN_QUEUE_TIMEOUT_SECONDS", "5"))
+# Headroom each concurrent job needs in OUTPUT_DIR for its cleaned video.
+OUTPUT_MIN_FREE_MB = int(os.getenv("OUTPUT_MIN_FREE_MB", str(256 * CLEAN_PROCESSES)))
+# tmpfs is only picked when it clearly fits: a full one makes cv2.VideoWriter drop frames silently.
+SHM_MIN_FREE_MB = max(256 * CLEAN_PROCESSES, OUTPUT_MIN_FREE_MB)
+_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+_SUFFIX_FALLBACK = ".mp4"
+SHM_OUTPUT_DIR = Path("/dev/shm/subtitle_cleaner")
+RESULT_CACHE_PATH = Path(os.getenv("RESULT_CACHE_PATH", "cache/results.json"))
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Answers 413 from the Content-Length header before the multipart body is read. Plain ASGI, so
+    requests to other paths pass straight through without an extra task or stream hop.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] in UPLOAD_PATHS:
+            content_length = Headers(scope=scope).get("content-length", "")
+            limit = MAX_FILE_SIZE_BYTES + MULTIPART_OVERHEAD_BYTES
+            if content_length.isdigit() and int(content_length) > limit:
+                response = ORJSONResponse({"detail": "File too large (limit 100 MB)"}, status_code=413)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+configure_logging()
+
+app = FastAPI(title="Subtitle Cleaner", version="0.2.0", default_response_class=ORJSONResponse)
+app.add_middleware(UploadSizeLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -33,10 +95,118 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-OUTPUT_DIR = Path("output")
+
+def _build_result_cache() -> Optional[ResultCache]:
+    # Without S3 the cleaned file is removed once the task finishes, so there is nothing to reuse.
+    if not S3_ENABLED or os.getenv("RESULT_CACHE", "true").lower() not in {"1", "true", "yes"}:
+        return None
+    presign_ttl = get_s3_settings().presign_ttl
+    # Presigned URLs expire: drop entries at half their lifetime so cache hits stay usable.
+    return ResultCache(RESULT_CACHE_PATH, ttl_seconds=presign_ttl / 2 if presign_ttl else None)
+
+
+def _free_mb(path: Path) -> float:
+    try:
+        return shutil.disk_usage(path).free / (1024 * 1024)
+    except OSError:
+        return 0.0
+
+
+def _resolve_output_dir() -> Path:
+    configured = os.getenv("OUTPUT_DIR")
+    if configured:
+        return Path(configured)
+    # With S3 the cleaned file only lives until it is uploaded, so keep it in RAM-backed tmpfs
+    # when there is room; Docker's default 64 MB /dev/shm is not, hence the fallback.
+    shm_root = SHM_OUTPUT_DIR.parent
+    if S3_ENABLED and shm_root.is_dir() and _free_mb(shm_root) >= SHM_MIN_FREE_MB:
+        return SHM_OUTPUT_DIR
+    return Path("output")
+
+
+OUTPUT_DIR = _resolve_output_dir()
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 processor = VideoProcessor()
 task_manager = TaskManager()
+result_cache = _build_result_cache()
+process_pool: Optional[ProcessPoolExecutor] = None
+_background_tasks: set[asyncio.Task] = set()
+
+
+@dataclass
+class CleanJob:
+    task_id: str
+    input_path: Path
+    output_path: Path
+    options: VideoProcessingOptions
+    callback_url: Optional[str]
+    cache_key: Optional[str] = None
+
+
+def _build_process_pool() -> ProcessPoolExecutor:
+    mp_context = multiprocessing.get_context("forkserver")
+    mp_context.set_forkserver_preload([worker.__name__])
+    return ProcessPoolExecutor(
+        max_workers=CLEAN_PROCESSES,
+        mp_context=mp_context,
+        initializer=worker.init_worker,
+    )
+
+
+@app.on_event("startup")
+def _check_output_space() -> None:
+    free_mb = _free_mb(OUTPUT_DIR)
+    if free_mb < OUTPUT_MIN_FREE_MB:
+        raise RuntimeError(
+            f"OUTPUT_DIR {OUTPUT_DIR} has {free_mb:.0f} MB free, need {OUTPUT_MIN_FREE_MB} MB "
+            "(adjust OUTPUT_DIR or OUTPUT_MIN_FREE_MB)"
+        )
+
+
+@app.on_event("startup")
+async def _start_clean_workers() -> None:
+    global process_pool
+    process_pool = _build_process_pool()
+    app.state.job_queue = asyncio.Queue(maxsize=CLEAN_QUEUE_SIZE)
+    # One consumer per pool process: the queue is the only backlog, the pool never queues.
+    app.state.job_consumers = [
+        asyncio.create_task(_consume_jobs(app.state.job_queue)) for _ in range(CLEAN_PROCESSES)
+    ]
+
+
+@app.on_event("shutdown")
+async def _stop_clean_workers() -> None:
+    for consumer in app.state.job_consumers:
+        consumer.cancel()
+    await asyncio.gather(*app.state.job_consumers, return_exceptions=True)
+    queue: asyncio.Queue = app.state.job_queue
+    while not queue.empty():
+        job = queue.get_nowait()
+        job.input_path.unlink(missing_ok=True)
+        task_manager.mark_failed(job.task_id, "Server shutting down")
+    if process_pool is not None:
+        process_pool.shutdown(wait=False, cancel_futures=True)
+
+
+@app.on_event("startup")
+async def _open_http_clients() -> None:
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(DOWNLOAD_TIMEOUT_SECONDS),
+        http2=True,
+        limits=HTTP_LIMITS,
+        follow_redirects=True,
+    )
+
+
+@app.on_event("shutdown")
+async def _close_http_clients() -> None:
+    # Give callbacks that are still in flight a moment to finish before their client goes away.
+    if _background_tasks:
+        _, pending = await asyncio.wait(set(_background_tasks), timeout=SHUTDOWN_CALLBACK_GRACE_SECONDS)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    await app.state.http.aclose()
 
 
 @app.get("/health")
@@ -52,14 +222,14 @@ async def clean_video(
     inpaint_radius: int = Form(4),
     subtitle_intensity_threshold: Optional[float] = Form(None),
     callback_url: Optional[str] = Form(None),
-) -> JSONResponse:
+) -> ORJSONResponse:
     if file is None and not file_url:
         raise HTTPException(status_code=400, detail="Either file or file_url must be provided")
 
     if file is not None and (file.content_type is None or not file.content_type.startswith("video")):
         raise HTTPException(status_code=400, detail="Expected video file upload")
 
-    if file_url and not file_url.lower().startswith(("http://", "https://")):
+    if file_url and not _URL_RE.match(file_url):
         raise HTTPException(status_code=400, detail="file_url must be http(s)")
 
     options = VideoProcessingOptions(
@@ -76,28 +246,43 @@ async def clean_video(
         logger.exception("Failed to persist input file")
         raise HTTPException(status_code=500, detail="Failed to persist input file") from exc
 
+    cache_key: Optional[str] = None
+    if result_cache is not None:
+        start_time = time.perf_counter()
+        try:
+            cache_key = build_cache_key(await asyncio.to_thread(hash_file, input_path), options)
+            cached = await asyncio.to_thread(result_cache.get, cache_key)
+        except BaseException:
+            input_path.unlink(missing_ok=True)
+            raise
+        if cached is not None:
+            # Already cleaned with these options: answer without queueing behind running jobs.
+            input_path.unlink(missing_ok=True)
+            task_id = task_manager.create_task(callback_url=callback_url)
+            _complete_task(task_id, cached, start_time, callback_url)
+            return ORJSONResponse({"status": "accepted", "task_id": task_id})
+
     task_id = task_manager.create_task(callback_url=callback_url)
-    output_path = OUTPUT_DIR / f"cleaned_{task_id}.mp4"
-    loop = asyncio.get_event_loop()
+    job = CleanJob(
+        task_id=task_id,
+        input_path=input_path,
+        output_path=OUTPUT_DIR / f"cleaned_{task_id}.mp4",
+        options=options,
+        callback_url=callback_url,
+        cache_key=cache_key,
+    )
     try:
-        future = loop.run_in_executor(
-            None,
-            lambda: _process_async_task(
-                task_id=task_id,
-                input_path=input_path,
-                output_path=output_path,
-                options=options,
-                callback_url=callback_url,
-            ),
-        )
-    except Exception as exc:  # noqa: BLE001
+        await asyncio.wait_for(app.state.job_queue.put(job), timeout=CLEAN_QUEUE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError as exc:
+        input_path.unlink(missing_ok=True)
+        task_manager.mark_failed(task_id, "Processing queue is full")
+        raise HTTPException(status_code=503, detail="Processing queue is full, retry later") from exc
+    except BaseException:
         input_path.unlink(missing_ok=True)
         task_manager.mark_failed(task_id, "Failed to schedule processing")
-        logger.exception("Unable to schedule background task %s", task_id)
-        raise HTTPException(status_code=500, detail="Failed to schedule processing") from exc
-    future.add_done_callback(_log_future_exception)
+        raise
 
-    return JSONResponse({"status": "accepted", "task_id": task_id})
+    return ORJSONResponse({"status": "accepted", "task_id": task_id})
 
 
 @app.post("/preview")
@@ -116,13 +301,9 @@ async def preview_frame(
         input_path = Path(tmp_in.name)
 
     try:
-        result = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: processor.preview_frame(
-                input_path,
-                frame_number,
-                VideoProcessingOptions(max_resolution=max_resolution, inpaint_radius=inpaint_radius),
-            ),
+        options = VideoProcessingOptions(max_resolution=max_resolution, inpaint_radius=inpaint_radius)
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, partial(processor.preview_frame, input_path, frame_number, options)
         )
     except Exception as exc:  # noqa: BLE001
         logger.exception("Preview generation failed")
@@ -130,45 +311,49 @@ async def preview_frame(
     finally:
         input_path.unlink(missing_ok=True)
 
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.get("/tasks/{task_id}")
-def get_task(task_id: str) -> JSONResponse:
+def get_task(task_id: str) -> ORJSONResponse:
     record = task_manager.get(task_id)
     if record is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return JSONResponse(record)
+    return ORJSONResponse(record)
 
 
 async def _persist_input(*, file: Optional[UploadFile], file_url: Optional[str]) -> Path:
     if file is not None:
         return await _save_uploaded_file(file)
     if file_url:
-        return await _download_file(file_url)
+        parsed = urlparse(file_url)
+        bucket_ref = resolve_bucket_key(parsed) if S3_ENABLED else None
+        # Reading through the S3 API uses our credentials, so only do it for objects the caller
+        # could fetch anyway; anything else takes the plain download (and its 403).
+        if bucket_ref is not None and (bucket_ref.published or await _caller_can_fetch(file_url)):
+            return await _download_from_bucket(bucket_ref.key)
+        return await _download_file(parsed, file_url)
     raise HTTPException(status_code=400, detail="Missing input file")
 
 
 async def _save_uploaded_file(upload: UploadFile) -> Path:
-    suffix = Path(upload.filename or "video").suffix or ".mp4"
-    await upload.seek(0)
-    total_bytes = 0
+    suffix = Path(upload.filename or "video").suffix or _SUFFIX_FALLBACK
     tmp_handle = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
     tmp_handle.close()
     tmp_path = Path(tmp_handle.name)
+    loop = asyncio.get_running_loop()
     try:
-        with tmp_path.open("wb") as dst:
-            while True:
-                chunk = await upload.read(STREAM_CHUNK_SIZE)
-                if not chunk:
-                    break
-                total_bytes += len(chunk)
-                if total_bytes > MAX_FILE_SIZE_BYTES:
-                    raise HTTPException(status_code=400, detail="File too large (limit 100 MB)")
-                dst.write(chunk)
+        total_bytes = await loop.run_in_executor(None, _copy_upload_to_path, upload.file, tmp_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
     finally:
         await upload.close()
 
+    if total_bytes > MAX_FILE_SIZE_BYTES:
+        tmp_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=413, detail="File too large (limit 100 MB)")
+
     if total_bytes == 0:
         tmp_path.unlink(missing_ok=True)
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
@@ -176,37 +361,100 @@ async def _save_uploaded_file(upload: UploadFile) -> Path:
     return tmp_path
 
 
-async def _download_file(file_url: str) -> Path:
-    parsed = urlparse(file_url)
-    suffix = Path(parsed.path).suffix or ".mp4"
+def _copy_upload_to_path(src: BinaryIO, dst_path: Path) -> int:
+    """
+    Copies the upload's backing file to ``dst_path`` and returns the number of bytes copied.
+    Stops as soon as the size limit is exceeded, so a return value above the limit means the
+    upload must be rejected.
+    """
+    src.seek(0)
+    limit = MAX_FILE_SIZE_BYTES + 1
+    with dst_path.open("wb") as dst:
+        src_fd = _upload_fileno(src)
+        if src_fd is not None:
+            # Starlette spills large uploads to a real temp file; copy it in kernel space.
+            dst_fd = dst.fileno()
+            total_bytes = 0
+            while total_bytes < limit:
+                count = min(UPLOAD_CHUNK_SIZE, limit - total_bytes)
+                sent = os.sendfile(dst_fd, src_fd, total_bytes, count)
+                if sent == 0:
+                    break
+                total_bytes += sent
+            return total_bytes
+
+        total_bytes = 0
+        while total_bytes < limit:
+            chunk = src.read(min(UPLOAD_CHUNK_SIZE, limit - total_bytes))
+            if not chunk:
+                break
+            dst.write(chunk)
+            total_bytes += len(chunk)
+        return total_bytes
+
+
+def _upload_fileno(src: BinaryIO) -> Optional[int]:
+    if not hasattr(os, "sendfile"):
+        return None
+    # SpooledTemporaryFile.fileno() forces a rollover to disk, so only use it once already rolled.
+    if isinstance(src, tempfile.SpooledTemporaryFile) and not src._rolled:
+        return None
+    try:
+        return src.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+async def _download_file(parsed: ParseResult, file_url: str) -> Path:
+    declared_bytes = await _probe_content_length(file_url)
+    if declared_bytes is not None and declared_bytes > MAX_FILE_SIZE_BYTES:
+        raise HTTPException(status_code=413, detail="File too large (limit 100 MB)")
+    suffix = Path(parsed.path).suffix or _SUFFIX_FALLBACK
     tmp_handle = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
     tmp_handle.close()
     tmp_path = Path(tmp_handle.name)
-    async with httpx.AsyncClient(timeout=httpx.Timeout(DOWNLOAD_TIMEOUT_SECONDS)) as client:
-        try:
-            async with client.stream("GET", file_url, follow_redirects=True) as response:
-                response.raise_for_status()
-                content_length = response.headers.get("Content-Length")
-                if content_length:
-                    try:
-                        if int(content_length) > MAX_FILE_SIZE_BYTES:
-                            raise HTTPException(status_code=400, detail="File too large (limit 100 MB)")
-                    except ValueError:
-                        logger.warning("Invalid Content-Length from %s: %s", file_url, content_length)
-                total_bytes = 0
-                with tmp_path.open("wb") as dst:
-                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+    try:
+        # Ask for the identity encoding so the raw stream can be written as-is, without
+        # running every chunk through httpx's content decoder, when the origin honours it.
+        async with app.state.http.stream(
+            "GET", file_url, headers={"Accept-Encoding": "identity"}
+        ) as response:
+            response.raise_for_status()
+            content_encoding = response.headers.get("Content-Encoding", "").strip().lower()
+            if content_encoding in ("", "identity"):
+                chunks = response.aiter_raw(DOWNLOAD_CHUNK_SIZE)
+                expected_bytes = _parse_content_length(response.headers.get("Content-Length"), file_url)
+            else:
+                # The origin ignored the identity request: decode, and since Content-Length then
+                # counts compressed bytes, fall back to the running size guard.
+                chunks = response.aiter_bytes(DOWNLOAD_CHUNK_SIZE)
+                expected_bytes = None
+            if expected_bytes is not None and expected_bytes > MAX_FILE_SIZE_BYTES:
+                raise HTTPException(status_code=413, detail="File too large (limit 100 MB)")
+            total_bytes = 0
+            with tmp_path.open("wb", buffering=0) as dst:
+                if expected_bytes is not None:
+                    # The transport refuses bodies that overrun Content-Length, so the length
+                    # check above already bounds the stream.
+                    _preallocate(dst.fileno(), expected_bytes)
+                    async for chunk in chunks:
+                        total_bytes += len(chunk)
+                        await asyncio.to_thread(dst.write, chunk)
+                else:
+                    async for chunk in chunks:
                         total_bytes += len(chunk)
                         if total_bytes > MAX_FILE_SIZE_BYTES:
-                            raise HTTPException(status_code=400, detail="File too large (limit 100 MB)")
-                        dst.write(chunk)
-        except HTTPException:
-            tmp_path.unlink(missing_ok=True)
-            raise
-        except Exception as exc:  # noqa: BLE001
-            tmp_path.unlink(missing_ok=True)
-            logger.exception("Failed to download %s", file_url)
-            raise HTTPException(status_code=400, detail="Unable to download file") from exc
+                            raise HTTPException(status_code=413, detail="File too large (limit 100 MB)")
+                        await asyncio.to_thread(dst.write, chunk)
+            if total_bytes > MAX_FILE_SIZE_BYTES:
+                raise HTTPException(status_code=413, detail="File too large (limit 100 MB)")
+    except HTTPException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    except Exception as exc:  # noqa: BLE001
+        tmp_path.unlink(missing_ok=True)
+        logger.exception("Failed to download {}", file_url)
+        raise HTTPException(status_code=400, detail="Unable to download file") from exc
 
     if total_bytes == 0:
         tmp_path.unlink(missing_ok=True)
@@ -215,32 +463,133 @@ async def _download_file(file_url: str) -> Path:
     return tmp_path
 
 
-def _process_async_task(
+async def _download_from_bucket(object_key: str) -> Path:
+    """Fetches an input that already lives in our bucket through the S3 API instead of its URL."""
+    suffix = Path(object_key).suffix or _SUFFIX_FALLBACK
+    tmp_handle = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    tmp_handle.close()
+    tmp_path = Path(tmp_handle.name)
+    try:
+        total_bytes = await asyncio.to_thread(get_object_size, object_key)
+        if total_bytes > MAX_FILE_SIZE_BYTES:
+            raise HTTPException(status_code=413, detail="File too large (limit 100 MB)")
+        if total_bytes == 0:
+            raise HTTPException(status_code=400, detail="Downloaded file is empty")
+        await asyncio.to_thread(download_object_to_path, object_key, tmp_path)
+    except HTTPException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    except Exception as exc:  # noqa: BLE001
+        tmp_path.unlink(missing_ok=True)
+        logger.exception("Failed to download s3 object {}", object_key)
+        raise HTTPException(status_code=400, detail="Unable to download file") from exc
+    return tmp_path
+
+
+async def _caller_can_fetch(file_url: str) -> bool:
+    """
+    Checks with a one-byte ranged GET that ``file_url`` is readable as given, i.e. unsigned
+    URLs of private objects and forged or expired presigned URLs are rejected.
+    """
+    try:
+        async with app.state.http.stream(
+            "GET", file_url, headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"}
+        ) as response:
+            return response.is_success
+    except httpx.HTTPError:
+        return False
+
+
+async def _probe_content_length(file_url: str) -> Optional[int]:
+    """
+    Asks for the size with a HEAD request so oversized files are refused before any body is
+    transferred. Origins that reject HEAD (e.g. presigned GET URLs) simply yield None.
+    """
+    try:
+        response = await app.state.http.head(file_url, headers={"Accept-Encoding": "identity"})
+    except httpx.HTTPError:
+        return None
+    if response.status_code >= 400:
+        return None
+    return _parse_content_length(response.headers.get("Content-Length"), file_url)
+
+
+def _parse_content_length(raw_value: Optional[str], file_url: str) -> Optional[int]:
+    if not raw_value:
+        return None
+    try:
+        parsed = int(raw_value)
+    except ValueError:
+        logger.warning("Invalid Content-Length from {}: {}", file_url, raw_value)
+        return None
+    return parsed if parsed >= 0 else None
+
+
+def _preallocate(fd: int, size: int) -> None:
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass  # not every filesystem supports it; writing without preallocation is fine
+
+
+async def _consume_jobs(queue: asyncio.Queue) -> None:
+    while True:
+        job: CleanJob = await queue.get()
+        try:
+            await _process_async_task(
+                task_id=job.task_id,
+                input_path=job.input_path,
+                output_path=job.output_path,
+                options=job.options,
+                callback_url=job.callback_url,
+                cache_key=job.cache_key,
+            )
+        except asyncio.CancelledError:
+            task_manager.mark_failed(job.task_id, "Server shutting down")
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Background task raised: {}", exc)
+        finally:
+            queue.task_done()
+
+
+async def _process_async_task(
     *,
     task_id: str,
     input_path: Path,
     output_path: Path,
     options: VideoProcessingOptions,
     callback_url: Optional[str],
+    cache_key: Optional[str] = None,
 ) -> None:
+    """
+    Runs one cleaning job on the process pool and records the outcome. Inputs already cleaned
+    with the same options are answered from the result cache without reprocessing.
+    """
+    loop = asyncio.get_running_loop()
     start_time = time.perf_counter()
     task_manager.mark_processing(task_id)
     try:
-        stats = processor.process_video(input_path, output_path, options)
-        video_url = _finalize_output_file(output_path)
-        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-        payload = {
-            "task_id": task_id,
-            "status": "completed",
-            "video_url": video_url,
-            "time_ms": elapsed_ms,
-            "stats": stats,
-        }
-        task_manager.mark_completed(task_id, payload)
-        if callback_url:
-            _post_callback(callback_url, payload)
+        # Fallback for an identical job that finished while this one was queued.
+        result = None
+        if result_cache is not None and cache_key:
+            result = await asyncio.to_thread(result_cache.get, cache_key)
+        if result is None:
+            pool = process_pool
+            try:
+                result = await loop.run_in_executor(
+                    pool, partial(worker.run_clean_job, input_path, output_path, options)
+                )
+            except BrokenProcessPool:
+                _restart_process_pool(pool)
+                raise
+            if result_cache is not None and cache_key:
+                await asyncio.to_thread(result_cache.put, cache_key, result)
+        _complete_task(task_id, result, start_time, callback_url)
     except Exception as exc:  # noqa: BLE001
-        logger.exception("Background processing failed for task %s", task_id)
+        logger.exception("Background processing failed for task {}", task_id)
         error_message = str(exc)
         failure_payload = {
             "task_id": task_id,
@@ -249,31 +598,62 @@ def _process_async_task(
         }
         task_manager.mark_failed(task_id, error_message)
         if callback_url:
-            _post_callback(callback_url, failure_payload)
+            _spawn_background(_post_callback(callback_url, failure_payload))
     finally:
         input_path.unlink(missing_ok=True)
-        if output_path.exists() and not is_s3_enabled():
-            output_path.unlink(missing_ok=True)
+        # In S3 mode the worker removes the file after uploading; this also covers jobs that
+        # failed or were cancelled first, so nothing is left behind in /dev/shm.
+        output_path.unlink(missing_ok=True)
 
 
-def _finalize_output_file(output_path: Path) -> str:
-    video_url = str(output_path.resolve())
-    if is_s3_enabled():
-        video_url = upload_video_and_get_url(output_path)
-        output_path.unlink(missing_ok=True)
-    return video_url
+def _complete_task(task_id: str, result: dict, start_time: float, callback_url: Optional[str]) -> None:
+    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+    payload = {
+        "task_id": task_id,
+        "status": "completed",
+        "video_url": result["video_url"],
+        "time_ms": elapsed_ms,
+        "stats": result["stats"],
+    }
+    task_manager.mark_completed(task_id, payload)
+    if callback_url:
+        _spawn_background(_post_callback(callback_url, payload))
 
 
-def _post_callback(url: str, payload: dict) -> None:
+def _restart_process_pool(broken_pool: ProcessPoolExecutor) -> None:
+    """Replaces the pool after a worker died (e.g. OOM-killed); a broken pool rejects all work."""
+    global process_pool
+    if process_pool is not broken_pool:
+        return  # another job already replaced it
+    logger.error("Process pool is broken; starting a new one")
+    process_pool = _build_process_pool()
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _post_callback(url: str, payload: dict) -> None:
     try:
-        response = httpx.post(url, json=payload, timeout=10)
+        # The shared client follows redirects for downloads; a callback must not be bounced on.
+        response = await app.state.http.post(
+            url, json=payload, timeout=CALLBACK_TIMEOUT_SECONDS, follow_redirects=False
+        )
         response.raise_for_status()
     except Exception as exc:  # noqa: BLE001
-        logger.error("Callback to %s failed: %s", url, exc)
+        logger.error("Callback to {} failed: {}", url, exc)
+
+
+def _spawn_background(coro) -> asyncio.Task:
+    """Schedules ``coro`` without awaiting it, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    task.add_done_callback(_log_future_exception)
+    return task
 
 
 def _log_future_exception(future) -> None:
+    if future.cancelled():
+        return
     try:
         future.result()
     except Exception as exc:  # noqa: BLE001
-        logger.error("Background task raised: %s", exc)
+        logger.error("Background task raised: {}", exc)
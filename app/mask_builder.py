@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import numpy as np
 
 from .classifier import TextTrack
 
 
 class MaskBuilder:
-    def build_mask(self, frame_shape: tuple[int, int], tracks: list[TextTrack], frame_idx: int) -> np.ndarray:
-        mask = np.zeros(frame_shape, dtype=np.uint8)
+    def build_mask(
+        self,
+        frame_shape: tuple[int, int],
+        tracks: list[TextTrack],
+        frame_idx: int,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        if out is not None and out.shape == tuple(frame_shape) and out.dtype == np.uint8:
+            mask = out
+            mask.fill(0)
+        else:
+            mask = np.zeros(frame_shape, dtype=np.uint8)
         for track in tracks:
             if track.classification != "subtitle":
                 continue
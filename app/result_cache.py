@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Optional
+
+from loguru import logger
+
+from .video_processor import VideoProcessingOptions
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb", buffering=0) as src:
+        while True:
+            chunk = src.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_cache_key(digest: str, options: VideoProcessingOptions) -> str:
+    parts = (digest, options.max_resolution, options.inpaint_radius, options.subtitle_intensity_threshold)
+    return "_".join(str(part) for part in parts)
+
+
+class ResultCache:
+    """
+    Maps an input digest plus processing options to the result of a finished job, so repeated
+    uploads of the same video skip processing. Kept as a small LRU persisted to a JSON file that
+    several server processes may share: writers merge under an exclusive ``flock`` on a sidecar
+    lock file, and readers reload the file whenever its mtime changes.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 1024, ttl_seconds: Optional[float] = None) -> None:
+        self.path = path
+        self.lock_path = path.with_name(f"{path.name}.lock")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._disk_mtime_ns = self._stat_mtime_ns()
+        self._entries: OrderedDict[str, dict] = OrderedDict(self._read_entries())
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        self._reload_if_changed()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl_seconds is not None and time() - entry["stored_at"] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry["result"].copy()
+
+    def put(self, key: str, result: dict) -> None:
+        with self._lock:
+            self._entries[key] = {"stored_at": time(), "result": result}
+            self._entries.move_to_end(key)
+            self._trim()
+            snapshot = list(self._entries.items())
+        self._save(snapshot)
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _stat_mtime_ns(self) -> Optional[int]:
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        mtime_ns = self._stat_mtime_ns()
+        if mtime_ns is None or mtime_ns == self._disk_mtime_ns:
+            return
+        # The file is only ever swapped in whole by os.replace, so it can be read without the lock.
+        self._adopt(self._read_entries(), mtime_ns)
+
+    def _adopt(self, disk_entries: list, mtime_ns: Optional[int]) -> None:
+        with self._lock:
+            # Entries from other processes become the least recently used ones.
+            adopted = OrderedDict(
+                (key, entry) for key, entry in disk_entries if key not in self._entries
+            )
+            adopted.update(self._entries)
+            self._entries = adopted
+            self._trim()
+            self._disk_mtime_ns = mtime_ns
+
+    def _read_entries(self) -> list:
+        try:
+            with self.path.open("r", encoding="utf-8") as src:
+                raw_entries = json.load(src)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable result cache {}: {}", self.path, exc)
+            return []
+        try:
+            return [(str(key), dict(entry)) for key, entry in raw_entries]
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed result cache {}", self.path)
+            return []
+
+    def _save(self, snapshot: list) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.lock_path.open("a") as lock_file:
+                # Serialise read-merge-write across processes so concurrent puts cannot drop entries.
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                merged: OrderedDict[str, dict] = OrderedDict(self._read_entries())
+                for key, entry in snapshot:
+                    merged[key] = entry
+                    merged.move_to_end(key)
+                while len(merged) > self.max_entries:
+                    merged.popitem(last=False)
+                self._write_entries(list(merged.items()))
+                mtime_ns = self._stat_mtime_ns()
+        except OSError as exc:
+            logger.warning("Failed to persist result cache {}: {}", self.path, exc)
+            return
+        self._adopt(list(merged.items()), mtime_ns)
+
+    def _write_entries(self, entries: list) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as dst:
+                json.dump(entries, dst)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
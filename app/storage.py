@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from urllib.parse import ParseResult, unquote, urlparse
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from loguru import logger
@@ -45,7 +47,7 @@ def get_s3_settings() -> S3Settings:
             if parsed > 0:
                 presign_ttl = parsed
         except ValueError:
-            logger.warning("Invalid S3_PRESIGN_SECONDS=%s; ignoring.", presign_env)
+            logger.warning("Invalid S3_PRESIGN_SECONDS={}; ignoring.", presign_env)
 
     return S3Settings(
         bucket=os.getenv("S3_BUCKET"),
@@ -59,8 +61,35 @@ def get_s3_settings() -> S3Settings:
     )
 
 
+# Evaluated once at import: the job hot path checks this on every completion.
+S3_ENABLED: bool = get_s3_settings().enabled
+
+
 def is_s3_enabled() -> bool:
-    return get_s3_settings().enabled
+    return S3_ENABLED
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    raw_value = os.getenv(name)
+    if not raw_value:
+        return default
+    try:
+        parsed = int(raw_value)
+    except ValueError:
+        logger.warning("Invalid {}={}; using {}.", name, raw_value, default)
+        return default
+    return parsed if parsed > 0 else default
+
+
+@lru_cache(maxsize=1)
+def get_transfer_config() -> TransferConfig:
+    chunksize_mb = _env_positive_int("S3_MULTIPART_CHUNKSIZE_MB", 16)
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=chunksize_mb * 1024 * 1024,
+        max_concurrency=_env_positive_int("S3_MAX_CONCURRENCY", 16),
+        use_threads=True,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -74,15 +103,36 @@ def _get_s3_client(settings: S3Settings):
     if settings.endpoint_url:
         boto_kwargs["endpoint_url"] = settings.endpoint_url
 
+    transfer_config = get_transfer_config()
+    boto_config = BotoConfig(
+        max_pool_connections=max(32, transfer_config.max_concurrency * 2),
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 5},
+    )
     if settings.force_path_style:
-        boto_kwargs["config"] = BotoConfig(s3={"addressing_style": "path"})
+        boto_config = boto_config.merge(BotoConfig(s3={"addressing_style": "path"}))
+    boto_kwargs["config"] = boto_config
 
     session = boto3.session.Session()
     return session.client("s3", **boto_kwargs)
 
 
-def _build_object_key(local_path: Path, settings: S3Settings) -> str:
-    filename = local_path.name
+def refresh_s3_settings() -> S3Settings:
+    """
+    Re-reads the S3 configuration from the environment. Modules that imported ``S3_ENABLED``
+    directly keep the value they saw at import time.
+    """
+    global S3_ENABLED
+    get_s3_settings.cache_clear()
+    get_transfer_config.cache_clear()
+    _get_s3_client.cache_clear()
+    _get_bucket_url_forms.cache_clear()
+    settings = get_s3_settings()
+    S3_ENABLED = settings.enabled
+    return settings
+
+
+def _build_object_key(filename: str, settings: S3Settings) -> str:
     if settings.prefix:
         return f"{settings.prefix}/{filename}"
     return filename
@@ -103,34 +153,134 @@ def _build_public_url(key: str, settings: S3Settings) -> str:
     return f"https://{settings.bucket}.s3.{region}.amazonaws.com/{key}"
 
 
-def upload_video_and_get_url(local_path: Path, content_type: str = "video/mp4") -> str:
+@dataclass(frozen=True)
+class _BucketUrlForms:
+    public_host: Optional[str]
+    public_path: Optional[str]
+    virtual_hosts: frozenset[str]
+    path_style_hosts: frozenset[str]
+    path_style_prefix: str
+
+
+@lru_cache(maxsize=1)
+def _get_bucket_url_forms(settings: S3Settings) -> _BucketUrlForms:
+    public_host = public_path = None
+    if settings.public_base_url:
+        base = urlparse(settings.public_base_url)
+        public_host = (base.hostname or "").lower()
+        public_path = unquote(base.path).rstrip("/") + "/"
+
+    if settings.endpoint_url:
+        endpoint_hosts = {(urlparse(settings.endpoint_url).hostname or "").lower()}
+    else:
+        region = settings.region_name or "us-east-1"
+        endpoint_hosts = {"s3.amazonaws.com", f"s3.{region}.amazonaws.com"}
+
+    bucket = settings.bucket.lower()
+    return _BucketUrlForms(
+        public_host=public_host,
+        public_path=public_path,
+        virtual_hosts=frozenset(f"{bucket}.{host}" for host in endpoint_hosts),
+        path_style_hosts=frozenset(endpoint_hosts),
+        path_style_prefix=f"/{settings.bucket}/",
+    )
+
+
+@dataclass(frozen=True)
+class BucketObjectRef:
+    key: str
+    # True when the URL sits under S3_PUBLIC_BASE_URL, which anyone may read; direct bucket URLs
+    # (even under our key prefix) may be private and must prove access first.
+    published: bool
+
+
+def resolve_bucket_key(parsed: ParseResult) -> Optional[BucketObjectRef]:
     """
-    Uploads the processed video to the configured S3 bucket and returns a URL that can be shared
-    with the caller. Falls back to presigned URLs when the bucket is private.
+    Returns a reference to the object when the parsed URL points into the configured bucket
+    (public base URL, custom endpoint, or AWS virtual-hosted/path-style URL), otherwise None.
     """
     settings = get_s3_settings()
     if not settings.enabled:
-        raise RuntimeError("S3 storage is not configured. Set S3_BUCKET to enable uploads.")
+        return None
+
+    forms = _get_bucket_url_forms(settings)
+    host = (parsed.hostname or "").lower()
+    path = unquote(parsed.path)
 
+    if forms.public_path is not None and host == forms.public_host and path.startswith(forms.public_path):
+        key = path[len(forms.public_path) :]
+        return BucketObjectRef(key=key, published=True) if key else None
+    if host in forms.virtual_hosts:
+        key = path.lstrip("/")
+    elif host in forms.path_style_hosts and path.startswith(forms.path_style_prefix):
+        key = path[len(forms.path_style_prefix) :]
+    else:
+        return None
+    if not key:
+        return None
+    return BucketObjectRef(key=key, published=False)
+
+
+def get_object_size(object_key: str) -> int:
+    settings = _require_s3_settings()
     client = _get_s3_client(settings)
-    object_key = _build_object_key(Path(local_path), settings)
-    extra_args: dict[str, str] = {}
-    if content_type:
-        extra_args["ContentType"] = content_type
-    if settings.object_acl:
-        extra_args["ACL"] = settings.object_acl
+    response = client.head_object(Bucket=settings.bucket, Key=object_key)
+    return int(response["ContentLength"])
+
+
+def download_object_to_path(object_key: str, local_path: Path) -> None:
+    """Downloads an object from the configured bucket with parallel ranged GETs."""
+    settings = _require_s3_settings()
+    client = _get_s3_client(settings)
+    client.download_file(
+        Bucket=settings.bucket,
+        Key=object_key,
+        Filename=str(local_path),
+        Config=get_transfer_config(),
+    )
+
+
+def upload_video_and_get_url(local_path: Path, content_type: str = "video/mp4") -> str:
+    """
+    Uploads the processed video to the configured S3 bucket and returns a URL that can be shared
+    with the caller. Falls back to presigned URLs when the bucket is private.
+    """
+    settings = _require_s3_settings()
+    client = _get_s3_client(settings)
+    object_key = _build_object_key(Path(local_path).name, settings)
 
     try:
         client.upload_file(
             Filename=str(local_path),
             Bucket=settings.bucket,
             Key=object_key,
-            ExtraArgs=extra_args or None,
+            ExtraArgs=_build_extra_args(content_type, settings),
+            Config=get_transfer_config(),
         )
     except (BotoCoreError, ClientError) as exc:  # pragma: no cover - network failure
-        logger.exception("Failed to upload %s to S3", local_path)
+        logger.exception("Failed to upload {} to S3", local_path)
         raise
 
+    return _build_object_url(client, object_key, settings)
+
+
+def _require_s3_settings() -> S3Settings:
+    settings = get_s3_settings()
+    if not settings.enabled:
+        raise RuntimeError("S3 storage is not configured. Set S3_BUCKET to enable uploads.")
+    return settings
+
+
+def _build_extra_args(content_type: Optional[str], settings: S3Settings) -> Optional[dict[str, str]]:
+    extra_args: dict[str, str] = {}
+    if content_type:
+        extra_args["ContentType"] = content_type
+    if settings.object_acl:
+        extra_args["ACL"] = settings.object_acl
+    return extra_args or None
+
+
+def _build_object_url(client, object_key: str, settings: S3Settings) -> str:
     if settings.presign_ttl:
         return client.generate_presigned_url(
             ClientMethod="get_object",
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from threading import Lock
 from time import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 
@@ -29,15 +29,28 @@ class TaskRecord:
         }
 
 
+SHARD_COUNT = 16
+
+
 class TaskManager:
-    def __init__(self) -> None:
-        self._tasks: Dict[str, TaskRecord] = {}
-        self._lock = Lock()
+    """
+    In-memory task registry split into lock-protected shards, so status polls and updates for
+    different tasks do not contend on a single lock.
+    """
+
+    def __init__(self, shard_count: int = SHARD_COUNT) -> None:
+        if shard_count <= 0 or shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+        self._shard_mask = shard_count - 1
+        self._shards: List[Tuple[Lock, Dict[str, TaskRecord]]] = [
+            (Lock(), {}) for _ in range(shard_count)
+        ]
 
     def create_task(self, callback_url: Optional[str] = None) -> str:
         task_id = uuid4().hex
-        with self._lock:
-            self._tasks[task_id] = TaskRecord(task_id=task_id, callback_url=callback_url)
+        lock, tasks = self._shard(task_id)
+        with lock:
+            tasks[task_id] = TaskRecord(task_id=task_id, callback_url=callback_url)
         return task_id
 
     def mark_processing(self, task_id: str) -> None:
@@ -50,8 +63,9 @@ class TaskManager:
         self._update(task_id, status="failed", error=error)
 
     def get(self, task_id: str) -> Optional[dict]:
-        with self._lock:
-            record = self._tasks.get(task_id)
+        lock, tasks = self._shard(task_id)
+        with lock:
+            record = tasks.get(task_id)
             if record is None:
                 return None
             data = record.to_dict()
@@ -59,6 +73,9 @@ class TaskManager:
                 data["result"] = data["result"].copy()
             return data
 
+    def _shard(self, task_id: str) -> Tuple[Lock, Dict[str, TaskRecord]]:
+        return self._shards[hash(task_id) & self._shard_mask]
+
     def _update(
         self,
         task_id: str,
@@ -67,8 +84,9 @@ class TaskManager:
         result: Optional[dict] = None,
         error: Optional[str] = None,
     ) -> None:
-        with self._lock:
-            record = self._tasks.get(task_id)
+        lock, tasks = self._shard(task_id)
+        with lock:
+            record = tasks.get(task_id)
             if record is None:
                 raise KeyError(f"Unknown task_id {task_id}")
             if status is not None:
@@ -19,6 +19,9 @@ class TextDetector:
 
         return PaddleOCR(use_gpu=False, lang=lang)
 
+    def warmup(self) -> None:
+        self._get_ocr(self.lang)
+
     def detect_text(self, frame: np.ndarray) -> List[Dict[str, Any]]:
         ocr = self._get_ocr(self.lang)
         results = ocr.ocr(frame, cls=False)
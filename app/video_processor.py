@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import base64
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -79,15 +81,57 @@ class TextTracker:
         return inter_area / union
 
 
+class FrameBuffers:
+    """Scratch arrays keyed by (name, shape, dtype), reused across frames and videos."""
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self.max_entries = max_entries
+        self._arrays: OrderedDict[Tuple[str, Tuple[int, ...], str], np.ndarray] = OrderedDict()
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype: np.dtype = np.uint8) -> np.ndarray:
+        key = (name, tuple(shape), np.dtype(dtype).str)
+        array = self._arrays.get(key)
+        if array is None:
+            array = np.empty(shape, dtype=dtype)
+            self._arrays[key] = array
+            if len(self._arrays) > self.max_entries:
+                self._arrays.popitem(last=False)
+        else:
+            self._arrays.move_to_end(key)
+        return array
+
+
 class VideoProcessor:
     def __init__(self) -> None:
         self.detector = TextDetector()
         self.mask_builder = MaskBuilder()
         self.inpainter = Inpainter()
+        self._local = threading.local()
+
+    def warmup(
+        self, resolutions: Sequence[int] = (720, 1080), buffers: Optional[FrameBuffers] = None
+    ) -> None:
+        """Loads the OCR model and preallocates buffers for 16:9 frames of the given heights."""
+        self.detector.warmup()
+        buffers = buffers or self._thread_buffers()
+        for height in resolutions:
+            width = height * 16 // 9
+            buffers.get("frame", (height, width, 3))
+            buffers.get("mask", (height, width))
+            buffers.get("cleaned", (height, width, 3))
 
     def process_video(
-        self, input_path: Path, output_path: Path, options: VideoProcessingOptions
+        self,
+        input_path: Path,
+        output_path: Path,
+        options: VideoProcessingOptions,
+        buffers: Optional[FrameBuffers] = None,
     ) -> Dict[str, float]:
+        """
+        Cleans the whole video. ``buffers`` holds the per-frame scratch arrays; concurrent callers
+        must not share one, and the calling thread's own set is used when omitted.
+        """
+        buffers = buffers or self._thread_buffers()
         metadata = probe_video(input_path)
         cap = cv2.VideoCapture(str(input_path))
         if not cap.isOpened():
@@ -97,6 +141,9 @@ class VideoProcessor:
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         tracker = TextTracker(height)
+        frame = buffers.get("frame", (height, width, 3))
+        mask_buffer = buffers.get("mask", (height, width))
+        cleaned_buffer = buffers.get("cleaned", (height, width, 3))
 
         fourcc = cv2.VideoWriter_fourcc(*"mp4v")
         writer = cv2.VideoWriter(str(output_path), fourcc, fps, (width, height))
@@ -107,16 +154,16 @@ class VideoProcessor:
         subtitle_frames = 0
         try:
             while True:
-                ret, frame = cap.read()
+                ret, frame = cap.read(frame)
                 if not ret:
                     break
-                processed_frame, scale = self._maybe_downscale(frame, options.max_resolution)
+                processed_frame, scale = self._maybe_downscale(frame, options.max_resolution, buffers)
                 detections = self._detect_with_stroke(processed_frame)
                 if scale != 1.0:
                     detections = [self._rescale_detection(det, scale) for det in detections]
                 tracks = tracker.update(detections, frame_idx, options.subtitle_intensity_threshold)
-                mask = self.mask_builder.build_mask(frame.shape[:2], tracks, frame_idx)
-                cleaned = self.inpainter.inpaint(frame, mask, options.inpaint_radius)
+                mask = self.mask_builder.build_mask(frame.shape[:2], tracks, frame_idx, out=mask_buffer)
+                cleaned = self.inpainter.inpaint(frame, mask, options.inpaint_radius, out=cleaned_buffer)
                 writer.write(cleaned)
                 if mask.max() > 0:
                     subtitle_frames += 1
@@ -158,15 +205,26 @@ class VideoProcessor:
             "after": self._encode_image(cleaned),
         }
 
+    def _thread_buffers(self) -> FrameBuffers:
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = FrameBuffers()
+        return buffers
+
     @staticmethod
-    def _maybe_downscale(frame: np.ndarray, max_resolution: int) -> tuple[np.ndarray, float]:
+    def _maybe_downscale(
+        frame: np.ndarray, max_resolution: int, buffers: Optional[FrameBuffers] = None
+    ) -> tuple[np.ndarray, float]:
         height, width = frame.shape[:2]
         max_dim = max(height, width)
         if max_dim <= max_resolution:
             return frame, 1.0
         scale = max_resolution / max_dim
         new_size = (int(width * scale), int(height * scale))
-        resized = cv2.resize(frame, new_size, interpolation=cv2.INTER_AREA)
+        dst = None
+        if buffers is not None:
+            dst = buffers.get("downscaled", (new_size[1], new_size[0]) + frame.shape[2:], frame.dtype)
+        resized = cv2.resize(frame, new_size, dst=dst, interpolation=cv2.INTER_AREA)
         return resized, scale
 
     def _detect_with_stroke(self, frame: np.ndarray) -> List[Dict]:
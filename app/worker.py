@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from .logging_utils import configure_logging
+from .storage import S3_ENABLED, upload_video_and_get_url
+from .video_processor import FrameBuffers, VideoProcessingOptions, VideoProcessor
+
+_processor: Optional[VideoProcessor] = None
+_buffers = FrameBuffers()
+
+
+def init_worker() -> None:
+    """Process pool initializer: builds and warms up one VideoProcessor per worker process."""
+    global _processor
+    configure_logging()
+    _processor = VideoProcessor()
+    try:
+        _processor.warmup(buffers=_buffers)
+    except Exception:  # noqa: BLE001
+        # An initializer error would break the whole pool; let the first job surface it instead.
+        logger.exception("Worker warmup failed")
+
+
+def _get_processor() -> VideoProcessor:
+    global _processor
+    if _processor is None:
+        _processor = VideoProcessor()
+    return _processor
+
+
+def run_clean_job(input_path: Path, output_path: Path, options: VideoProcessingOptions) -> dict:
+    """
+    Cleans ``input_path`` into ``output_path`` and publishes the result. Runs inside a pool
+    worker, so it only returns plain data; task bookkeeping stays in the API process.
+    """
+    stats = _get_processor().process_video(input_path, output_path, options, buffers=_buffers)
+    video_url = _finalize_output_file(output_path)
+    return {"video_url": video_url, "stats": stats}
+
+
+def _finalize_output_file(output_path: Path) -> str:
+    video_url = str(output_path.resolve())
+    if S3_ENABLED:
+        try:
+            video_url = upload_video_and_get_url(output_path)
+        finally:
+            output_path.unlink(missing_ok=True)
+    return video_url